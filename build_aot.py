@@ -0,0 +1,44 @@
+"""
+Ahead-of-time build of the native mortgage math module.
+
+Compiles the amortization and DTI formulas into
+`src/loan_affordability/affordability_native*.so` with `numba.pycc`, so the
+calculators run native code with no JIT warmup and without numba installed
+at runtime.
+
+Usage:
+    poetry run python build_aot.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+cc = CC("affordability_native")
+cc.output_dir = str(Path(__file__).parent / "src" / "loan_affordability")
+
+
+@cc.export("pmt", "f8(f8,f8,i8)")
+def pmt(loan, rate, years):
+    """Monthly payment using the amortization formula (unrounded)."""
+    monthly_rate = rate / 12
+    term_months = years * 12
+
+    if monthly_rate == 0:
+        return loan / term_months
+
+    c = (1 + monthly_rate) ** term_months
+    return loan * (monthly_rate * c) / (c - 1)
+
+
+@cc.export("dti", "f8(f8,f8,f8)")
+def dti(annual_income, monthly_debts, monthly_mortgage_payment):
+    """Debt-to-Income ratio (unrounded, 0.0 for zero income)."""
+    if annual_income == 0:
+        return 0.0
+
+    return (monthly_debts + monthly_mortgage_payment) / (annual_income / 12)
+
+
+if __name__ == "__main__":
+    cc.compile()
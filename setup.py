@@ -0,0 +1,31 @@
+"""
+Build script for the optional Cython extension.
+
+Usage:
+    poetry run python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension(
+        "loan_affordability._native",
+        ["src/loan_affordability/_native.pyx"],
+        language="c++",
+        extra_compile_args=["-O3", "-ffast-math"],
+    )
+]
+
+setup(
+    name="loan-affordability-native",
+    package_dir={"": "src"},
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={
+            "boundscheck": False,
+            "cdivision": True,
+            "language_level": 3,
+        },
+    ),
+)
@@ -0,0 +1,34 @@
+"""
+Compiled mortgage math.
+
+Cython versions of the amortization and DTI formulas used by
+MortgageCalculator. Built with `python setup.py build_ext --inplace`; the
+calculators fall back to Python when the extension is not built.
+"""
+
+from libc.math cimport pow
+
+
+cpdef double pmt(double loan, double rate, long years) noexcept nogil:
+    """Monthly payment using the amortization formula (unrounded)."""
+    cdef double monthly_rate = rate / 12
+    cdef long term_months = years * 12
+    cdef double c
+
+    if monthly_rate == 0:
+        return loan / term_months
+
+    c = pow(1 + monthly_rate, term_months)
+    return loan * (monthly_rate * c) / (c - 1)
+
+
+cpdef double dti(
+    double annual_income,
+    double monthly_debts,
+    double monthly_mortgage_payment
+) noexcept nogil:
+    """Debt-to-Income ratio (unrounded, 0.0 for zero income)."""
+    if annual_income == 0:
+        return 0.0
+
+    return (monthly_debts + monthly_mortgage_payment) / (annual_income / 12)
@@ -20,6 +20,13 @@ from loan_affordability.service import (
     Decision
 )
 
+# Display style per decision: (icon, color, message)
+_DECISION_STYLE = {
+    Decision.APPROVED: ("✓", "green", "has been approved."),
+    Decision.REVIEW: ("⚠", "yellow", "requires manual review."),
+    Decision.DECLINED: ("✗", "red", "has been declined."),
+}
+
 
 @click.command()
 @click.option(
@@ -91,32 +98,14 @@ def evaluate_affordability(income: float, debts: float, loan: float, credit: int
     # Display decision with color coding
     click.echo("\n" + "=" * 60)
 
-    if result.decision == Decision.APPROVED:
-        click.secho(
-            f"✓ DECISION: {result.decision.value}",
-            fg='green',
-            bold=True
-        )
-        click.echo("=" * 60)
-        click.echo("The application has been approved.")
-
-    elif result.decision == Decision.REVIEW:
-        click.secho(
-            f"⚠ DECISION: {result.decision.value}",
-            fg='yellow',
-            bold=True
-        )
-        click.echo("=" * 60)
-        click.echo("The application requires manual review.")
-
-    elif result.decision == Decision.DECLINED:
-        click.secho(
-            f"✗ DECISION: {result.decision.value}",
-            fg='red',
-            bold=True
-        )
-        click.echo("=" * 60)
-        click.echo("The application has been declined.")
+    icon, color, message = _DECISION_STYLE[result.decision]
+    click.secho(
+        f"{icon} DECISION: {result.decision.value}",
+        fg=color,
+        bold=True
+    )
+    click.echo("=" * 60)
+    click.echo(f"The application {message}")
 
     click.echo("")
 
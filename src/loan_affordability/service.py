@@ -5,9 +5,52 @@ A mortgage affordability assessment tool that evaluates loan applications
 based on DTI ratios, stress testing, LTI caps, and risk-based pricing.
 """
 
-from dataclasses import dataclass, field
+import math
+import warnings
+from bisect import bisect_left, bisect_right
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import Dict, Tuple, Optional
+from functools import lru_cache
+from math import expm1, log1p
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple, Optional
+
+import numpy as np
+
+try:
+    # Cython extension built by setup.py
+    from loan_affordability._native import (
+        pmt as _native_pmt,
+        dti as _native_dti
+    )
+except ImportError:
+    try:
+        # AOT-compiled by build_aot.py; needs no numba at runtime
+        from loan_affordability.affordability_native import (
+            pmt as _native_pmt,
+            dti as _native_dti
+        )
+    except ImportError:
+        _native_pmt = _native_dti = None
+
+
+@lru_cache(maxsize=None)
+def _load_kernels() -> Tuple[Optional[Callable], Optional[Callable]]:
+    """
+    Import the Numba kernels as (scalar, batch), or (None, None).
+
+    Deferred to first use: importing numba and loading the eagerly typed
+    kernel costs far more than a single CLI evaluation.
+    """
+    try:
+        from loan_affordability.service_numba import _score_batch, _score_core
+    except ImportError:  # numba is an optional dependency
+        return None, None
+    return _score_core, _score_batch
+
+
+# Placeholder for a kernel that _load_kernels has not resolved yet
+_UNBOUND = object()
 
 
 class Decision(Enum):
@@ -17,7 +60,7 @@ class Decision(Enum):
     DECLINED = "DECLINED"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoanApplication:
     """Input data for a loan application."""
     annual_income: float
@@ -30,6 +73,87 @@ class LoanApplication:
 
 
 @dataclass
+class LoanApplicationBatch:
+    """Column-wise (structure-of-arrays) input data for many applications."""
+    annual_income: np.ndarray
+    monthly_debts: np.ndarray
+    loan_amount: np.ndarray
+    credit_score: np.ndarray
+    base_rate: np.ndarray
+    stress_rate: np.ndarray
+    term_years: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.loan_amount)
+
+    @classmethod
+    def from_records(cls, apps: list[LoanApplication]) -> "LoanApplicationBatch":
+        """Pack LoanApplication objects into contiguous columns."""
+        columns = {
+            f.name: np.fromiter(
+                (getattr(app, f.name) for app in apps),
+                # Terms read as floats so fractional years are caught, not cut
+                dtype=(np.float64 if f.name == "term_years"
+                       else _BATCH_DTYPES[f.name]),
+                count=len(apps)
+            )
+            for f in fields(LoanApplication)
+        }
+        columns["term_years"] = _term_years_column(columns["term_years"])
+        return cls(**columns)
+
+    @classmethod
+    def from_array(cls, apps: np.ndarray | Any) -> "LoanApplicationBatch":
+        """
+        Build a batch from a structured ndarray (or DataFrame).
+
+        Fields are named after `LoanApplication` attributes; optional fields
+        fall back to the `LoanApplication` defaults.
+        """
+        if hasattr(apps, "to_records"):  # pandas DataFrame
+            apps = apps.to_records(index=False)
+
+        names = apps.dtype.names or ()
+        columns = {}
+        for f in fields(LoanApplication):
+            dtype = _BATCH_DTYPES[f.name]
+            if f.name == "term_years" and f.name in names:
+                columns[f.name] = _term_years_column(apps[f.name])
+            elif f.name in names:
+                columns[f.name] = np.ascontiguousarray(apps[f.name], dtype=dtype)
+            elif f.default is not MISSING:
+                columns[f.name] = np.full(len(apps), f.default, dtype=dtype)
+            else:
+                raise ValueError(f"Batch is missing required field '{f.name}'")
+        return cls(**columns)
+
+    def execute(
+        self, policy: Optional["LendingPolicy"] = None
+    ) -> "AffordabilityBatchResult":
+        """Run the vectorized affordability workflow over this batch."""
+        return MortgageService(policy).execute_workflow_batch(self)
+
+
+_BATCH_DTYPES: Dict[str, type] = {
+    "annual_income": np.float64,
+    "monthly_debts": np.float64,
+    "loan_amount": np.float64,
+    "credit_score": np.int32,
+    "base_rate": np.float64,
+    "stress_rate": np.float64,
+    "term_years": np.int32,
+}
+
+
+def _term_years_column(years: np.ndarray) -> np.ndarray:
+    """Cast a term column to the batch dtype, rejecting fractional years."""
+    years = np.asarray(years)
+    if years.dtype.kind not in "iu" and np.any(np.mod(years, 1) != 0):
+        raise ValueError("Loan term must be a whole number of years")
+    return np.ascontiguousarray(years, dtype=_BATCH_DTYPES["term_years"])
+
+
+@dataclass(slots=True, frozen=True)
 class AffordabilityResult:
     """Output data from affordability assessment."""
     max_mortgage: float
@@ -41,9 +165,109 @@ class AffordabilityResult:
     recommended_rate: Optional[float]  # ← None for DECLINED
 
 
+# Decision codes: 0 = declined, 1 = review, 2 = approved
+DECISION_CODES: Tuple[Decision, ...] = (
+    Decision.DECLINED, Decision.REVIEW, Decision.APPROVED
+)
+
+
 @dataclass
+class AffordabilityBatchResult:
+    """Column-wise output data from a batch affordability assessment."""
+    max_mortgage: np.ndarray
+    monthly_payment: np.ndarray
+    dti_ratio: np.ndarray
+    stress_test_passed: np.ndarray
+    decision_code: np.ndarray  # ← index into DECISION_CODES
+    risk_grade: np.ndarray  # ← "" for DECLINED
+    recommended_rate: np.ndarray  # ← NaN for DECLINED
+
+    def __len__(self) -> int:
+        return len(self.decision_code)
+
+    @property
+    def decisions(self) -> list[Decision]:
+        """Decode decision codes into Decision members."""
+        return [DECISION_CODES[code] for code in self.decision_code]
+
+    def to_results(self) -> list[AffordabilityResult]:
+        """Expand the columns into per-application results."""
+        return [
+            AffordabilityResult(
+                max_mortgage=float(self.max_mortgage[i]),
+                monthly_payment=float(self.monthly_payment[i]),
+                dti_ratio=float(self.dti_ratio[i]),
+                stress_test_passed=bool(self.stress_test_passed[i]),
+                decision=DECISION_CODES[self.decision_code[i]],
+                risk_grade=str(self.risk_grade[i]) or None,
+                recommended_rate=(
+                    None if np.isnan(self.recommended_rate[i])
+                    else float(self.recommended_rate[i])
+                )
+            )
+            for i in range(len(self))
+        ]
+
+
+# Basis-point range (int32); non-finite ratios saturate to the bounds
+_BP_MIN = int(np.iinfo(np.int32).min)
+_BP_MAX = int(np.iinfo(np.int32).max)
+
+
+def to_basis_points(ratio: float) -> int:
+    """
+    Quantize a ratio to integer basis points (0.4321 → 4321).
+
+    Saturated to the int32 range; NaN maps to the maximum so it sits above
+    every threshold.
+    """
+    bp = ratio * 10000
+    if bp != bp or bp >= _BP_MAX:  # NaN or too large (incl. inf)
+        return _BP_MAX
+    if bp <= _BP_MIN:
+        return _BP_MIN
+    return round(bp)
+
+
+def _to_basis_points_vec(ratio: np.ndarray) -> np.ndarray:
+    """Vectorized `to_basis_points`, saturated to the int32 range."""
+    bp = np.nan_to_num(np.rint(ratio * 10000), nan=_BP_MAX)
+    return np.clip(bp, _BP_MIN, _BP_MAX).astype(np.int32)
+
+
+# Decision ladder specialized per policy by LendingPolicy.__post_init__;
+# thresholds are substituted as literals so they compile to constants
+_DECIDE_TEMPLATE = """
+def _decide(dti, loan_amount, max_mortgage, stress_passed, credit_score):
+    dti_bp = to_basis_points(dti)
+    utilization = loan_amount / max_mortgage if max_mortgage > 0 else INF
+
+    if max_mortgage <= 0 or dti_bp > {max_dti_bp} or utilization > {max_lti_excess}:
+        return DECLINED, None
+
+    if utilization > {review_lti_excess} or dti_bp > {review_threshold_bp} or not stress_passed:
+        return REVIEW, {review_grade}
+
+    return APPROVED, max(get_credit_grade(credit_score), dti_grade_bp(dti_bp))
+"""
+
+
+def _float_literal(value: float) -> str:
+    """Source literal for a float threshold (numpy scalars coerced first)."""
+    value = float(value)
+    if not math.isfinite(value):
+        return f"float('{value}')"
+    return repr(value)
+
+
+@dataclass(slots=True, frozen=True)
 class LendingPolicy:
-    """Configurable lending policy thresholds and multipliers."""
+    """
+    Configurable lending policy thresholds and multipliers.
+
+    Immutable: lookup tables and the decision ladder are derived once at
+    construction, so use `dataclasses.replace` to change a threshold.
+    """
     max_dti: float = 0.50
     review_threshold: float = 0.43
     stress_threshold: float = 0.43
@@ -54,65 +278,194 @@ class LendingPolicy:
     max_lti_excess: float = 1.2  # Max 20% over calculated limit
     review_lti_excess: float = 1.1  # Flag for review if 10%+ over
 
-    multipliers: Dict[int, float] = field(default_factory=lambda: {
+    multipliers: Mapping[int, float] = field(default_factory=lambda: {
         750: 4.5, 700: 4.0, 650: 3.5, 0: 3.0
     })
-    credit_grades: Dict[int, str] = field(default_factory=lambda: {
+    credit_grades: Mapping[int, str] = field(default_factory=lambda: {
         750: "A", 700: "B", 0: "C"
     })
-    dti_grades: Dict[float, str] = field(default_factory=lambda: {
+    dti_grades: Mapping[float, str] = field(default_factory=lambda: {
         0.30: "A", 0.40: "B", 1.00: "C"
     })
-    rate_adjustments: Dict[str, float] = field(default_factory=lambda: {
+    rate_adjustments: Mapping[str, float] = field(default_factory=lambda: {
         "A": -0.004, "B": 0.000, "C": 0.013
     })
 
+    # Derived lookup tables, built in __post_init__
+    _mult_thresholds: list[int] = field(init=False, repr=False, compare=False)
+    _mult_values: list[float] = field(init=False, repr=False, compare=False)
+    _credit_thresholds: list[int] = field(init=False, repr=False, compare=False)
+    _credit_values: list[str] = field(init=False, repr=False, compare=False)
+    _dti_thresholds_bp: list[int] = field(init=False, repr=False, compare=False)
+    _dti_values: list[str] = field(init=False, repr=False, compare=False)
+    _rate_table: Dict[str, float] = field(init=False, repr=False, compare=False)
+    _rate_table_default: float = field(init=False, repr=False, compare=False)
+    _max_dti_bp: int = field(init=False, repr=False, compare=False)
+    _review_threshold_bp: int = field(init=False, repr=False, compare=False)
+    _stress_threshold_bp: int = field(init=False, repr=False, compare=False)
+    _decide: Callable[..., Tuple[Decision, Optional[str]]] = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Pre-compute lookup tables and compile the decision ladder."""
+        # Frozen: derived state is assigned through object.__setattr__, and the
+        # tables are snapshotted read-only so they cannot drift from it
+        set_ = object.__setattr__
+        for name in ("multipliers", "credit_grades", "dti_grades",
+                     "rate_adjustments"):
+            set_(self, name, MappingProxyType(dict(getattr(self, name))))
+
+        set_(self, "_mult_thresholds", sorted(self.multipliers))
+        set_(self, "_mult_values", [
+            self.multipliers[k] for k in self._mult_thresholds])
+
+        set_(self, "_credit_thresholds", sorted(self.credit_grades))
+        set_(self, "_credit_values", [
+            self.credit_grades[k] for k in self._credit_thresholds])
+
+        # DTI grade thresholds in basis points, like the decision thresholds
+        dti_thresholds = sorted(self.dti_grades)
+        set_(self, "_dti_thresholds_bp", [
+            to_basis_points(k) for k in dti_thresholds])
+        set_(self, "_dti_values", [self.dti_grades[k] for k in dti_thresholds])
+
+        # Recommended rate per grade (unknown grades get no adjustment)
+        set_(self, "_rate_table", {
+            grade: self.base_market_rate + adjustment
+            for grade, adjustment in self.rate_adjustments.items()
+        })
+        set_(self, "_rate_table_default", self.base_market_rate)
+
+        # DTI thresholds in fixed-point basis points (DTI is quantized to match)
+        set_(self, "_max_dti_bp", to_basis_points(self.max_dti))
+        set_(self, "_review_threshold_bp",
+             to_basis_points(self.review_threshold))
+        set_(self, "_stress_threshold_bp",
+             to_basis_points(self.stress_threshold))
+
+        # Decision ladder compiled with this policy's thresholds inlined
+        source = _DECIDE_TEMPLATE.format(
+            max_dti_bp=self._max_dti_bp,
+            max_lti_excess=_float_literal(self.max_lti_excess),
+            review_lti_excess=_float_literal(self.review_lti_excess),
+            review_threshold_bp=self._review_threshold_bp,
+            review_grade=repr(str(self.default_review_grade))
+        )
+        namespace = {
+            "DECLINED": Decision.DECLINED,
+            "REVIEW": Decision.REVIEW,
+            "APPROVED": Decision.APPROVED,
+            "INF": math.inf,
+            "to_basis_points": to_basis_points,
+            "get_credit_grade": self.get_credit_grade,
+            "dti_grade_bp": self._dti_grade_bp,
+        }
+        exec(compile(source, "<LendingPolicy._decide>", "exec"), namespace)
+        set_(self, "_decide", namespace["_decide"])
+
+    def __reduce__(self):
+        """Pickle the init fields only; derived state is rebuilt on load."""
+        return (self.__class__, tuple(
+            dict(value) if isinstance(value, MappingProxyType) else value
+            for value in (getattr(self, f.name) for f in fields(self) if f.init)
+        ))
+
     def get_multiplier(self, score: int) -> float:
         """Return income multiplier based on credit score."""
-        for threshold in sorted(self.multipliers.keys(), reverse=True):
-            if score >= threshold:
-                return self.multipliers[threshold]
-        return 3.0
+        idx = bisect_right(self._mult_thresholds, score) - 1
+        return self._mult_values[idx] if idx >= 0 else 3.0
 
     def get_credit_grade(self, score: int) -> str:
         """Return grade based on credit score."""
-        for threshold in sorted(self.credit_grades.keys(), reverse=True):
-            if score >= threshold:
-                return self.credit_grades[threshold]
-        return "C"
+        idx = bisect_right(self._credit_thresholds, score) - 1
+        return self._credit_values[idx] if idx >= 0 else "C"
 
     def get_dti_grade(self, dti: float) -> str:
         """Return grade based on DTI ratio."""
-        for threshold in sorted(self.dti_grades.keys()):
-            if dti <= threshold:
-                return self.dti_grades[threshold]
-        return "C"
+        return self._dti_grade_bp(to_basis_points(dti))
+
+    def _dti_grade_bp(self, dti_bp: int) -> str:
+        """Return grade for a DTI ratio already in basis points."""
+        idx = bisect_left(self._dti_thresholds_bp, dti_bp)
+        return self._dti_values[idx] if idx < len(self._dti_values) else "C"
 
     def get_recommended_rate(self, risk_grade: str) -> float:
         """Calculate recommended interest rate based on risk grade."""
-        adjustment = self.rate_adjustments.get(risk_grade, 0.0)
-        return round(self.base_market_rate + adjustment, 4)
+        return self._rate_table.get(risk_grade, self._rate_table_default)
 
 
 class MortgageCalculator:
     """Static utility methods for mortgage calculations."""
 
     @staticmethod
-    def calculate_monthly_payment(loan: float, rate: float, years: int = 25) -> float:
-        """Calculate monthly payment using amortization formula."""
+    def _validate_term(years: int) -> None:
+        """Reject terms the native kernels would truncate or divide by."""
         if years <= 0:
             raise ValueError("Loan term must be positive")
+        if years % 1 != 0:  # NaN included
+            raise ValueError("Loan term must be a whole number of years")
+
+    @staticmethod
+    def _amortize(loan: float, rate: float, years: int) -> float:
+        """Amortization formula (term must already be validated)."""
+        if _native_pmt is not None:
+            return _native_pmt(loan, rate, years)
 
         monthly_rate = rate / 12
         term_months = years * 12
 
-        if monthly_rate == 0:
-            return round(loan / term_months, 2)
+        # x = (1 + r)^n - 1 without cancellation for small r
+        x = expm1(term_months * log1p(monthly_rate))
 
-        payment = loan * (monthly_rate * (1 + monthly_rate) ** term_months) / \
-            ((1 + monthly_rate) ** term_months - 1)
+        if x == 0:
+            return loan / term_months
 
-        return round(payment, 2)
+        return loan * monthly_rate * (1 + x) / x
+
+    @staticmethod
+    def calculate_monthly_payment(loan: float, rate: float, years: int = 25) -> float:
+        """Calculate monthly payment using amortization formula."""
+        MortgageCalculator._validate_term(years)
+
+        return MortgageCalculator._amortize(loan, rate, years)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def stress_payment_ratio(base_rate: float, stress_rate: float, years: int = 25) -> float:
+        """
+        Return stressed / base monthly payment for the given rates and term.
+
+        The ratio does not depend on the loan amount; results are kept in a
+        bounded LRU keyed on (base_rate, stress_rate, years).
+        """
+        MortgageCalculator._validate_term(years)
+
+        return MortgageCalculator._amortize(1.0, stress_rate, years) / \
+            MortgageCalculator._amortize(1.0, base_rate, years)
+
+    @staticmethod
+    def calculate_payment_pair(
+        loan: float,
+        base_rate: float,
+        stress_rate: float,
+        years: int = 25,
+        homogeneous_rates: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Calculate base and stressed monthly payments.
+
+        With `homogeneous_rates` (the same rates and term across a portfolio)
+        only the base payment is amortized and the stressed payment is scaled
+        by the cached `stress_payment_ratio`; otherwise both are amortized.
+        """
+        MortgageCalculator._validate_term(years)
+
+        payment = MortgageCalculator._amortize(loan, base_rate, years)
+        if homogeneous_rates:
+            return payment, payment * MortgageCalculator.stress_payment_ratio(
+                base_rate, stress_rate, years)
+
+        return payment, MortgageCalculator._amortize(loan, stress_rate, years)
 
     @staticmethod
     def calculate_dti(
@@ -121,12 +474,66 @@ class MortgageCalculator:
         monthly_mortgage_payment: float
     ) -> float:
         """Calculate Debt-to-Income ratio."""
+        if _native_dti is not None:
+            return _native_dti(
+                annual_income, monthly_debts, monthly_mortgage_payment)
+
         if annual_income == 0:
             return 0.0
 
         monthly_income = annual_income / 12
         total_monthly_debt = monthly_debts + monthly_mortgage_payment
-        return round(total_monthly_debt / monthly_income, 4)
+        return total_monthly_debt / monthly_income
+
+    @staticmethod
+    def calculate_monthly_payment_vec(
+        loan: np.ndarray,
+        rate: np.ndarray,
+        years: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized amortization formula.
+
+        `rate` may carry a leading axis (e.g. shape (2, N) for base and
+        stress rates) which broadcasts against `loan` and `years`.
+        """
+        years = np.asarray(years)
+        if np.any(years <= 0):
+            raise ValueError("Loan term must be positive")
+
+        monthly_rate = np.asarray(rate, dtype=np.float64) / 12
+        term_months = years * 12
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = np.power(1 + monthly_rate, term_months)
+            payment = np.where(
+                monthly_rate == 0,
+                loan / term_months,
+                loan * (monthly_rate * c) / (c - 1)
+            )
+
+        return payment
+
+    @staticmethod
+    def calculate_dti_vec(
+        annual_income: np.ndarray,
+        monthly_debts: np.ndarray,
+        monthly_mortgage_payment: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized Debt-to-Income ratio (0.0 where income is zero)."""
+        total_monthly_debt = np.asarray(
+            monthly_debts + monthly_mortgage_payment, dtype=np.float64
+        )
+        # Tiny incomes overflow to an inf DTI and inf / inf gives NaN; both
+        # are declined downstream, as on the scalar path
+        with np.errstate(over="ignore", invalid="ignore"):
+            dti = np.divide(
+                total_monthly_debt * 12,
+                annual_income,
+                out=np.zeros_like(total_monthly_debt),
+                where=np.asarray(annual_income) != 0
+            )
+        return dti
 
 
 class AffordabilityEvaluator:
@@ -143,7 +550,8 @@ class AffordabilityEvaluator:
         monthly_payment: float
     ) -> AffordabilityResult:
         """Evaluate loan application and return affordability result."""
-        stress_passed = dti_stress <= self.policy.stress_threshold
+        stress_passed = \
+            to_basis_points(dti_stress) <= self.policy._stress_threshold_bp
 
         max_mortgage = app.annual_income * \
             self.policy.get_multiplier(app.credit_score)
@@ -163,9 +571,9 @@ class AffordabilityEvaluator:
             recommended_rate = self.policy.get_recommended_rate(risk_grade)
 
         return AffordabilityResult(
-            max_mortgage=round(max_mortgage, 2),
-            monthly_payment=round(monthly_payment, 2),
-            dti_ratio=round(dti, 4),
+            max_mortgage=max_mortgage,
+            monthly_payment=monthly_payment,
+            dti_ratio=dti,
             stress_test_passed=stress_passed,
             decision=decision,
             risk_grade=risk_grade,  # None for declined
@@ -188,66 +596,303 @@ class AffordabilityEvaluator:
         2. Check LTI (Loan-to-Income) cap
         3. Check review thresholds (DTI or stress test)
         4. Calculate grade for approved applications
-        """
-
-     # Guard Clause: If they can't borrow anything, it's an immediate decline
-        if max_mortgage <= 0 :
-            return Decision.DECLINED, None
-
-        # 1. Check DTI hard limit
-        if dti > self.policy.max_dti:
-            return Decision.DECLINED, None
-
-        # 2. Check Limit Utilization (how much of their max allowed are they asking for?)
-        utilization = loan_amount / max_mortgage
-
-        if utilization > self.policy.max_lti_excess:
-            return Decision.DECLINED, None
 
-        if utilization > self.policy.review_lti_excess:
-            return Decision.REVIEW, self.policy.default_review_grade
-
-        # 3. Check DTI/Stress Review thresholds
-        if dti > self.policy.review_threshold or not stress_passed:
-            return Decision.REVIEW, self.policy.default_review_grade
+        The ladder is generated per policy (see `LendingPolicy._decide`).
+        """
+        return self.policy._decide(
+            dti, loan_amount, max_mortgage, stress_passed, credit_score)
 
-        # 4. APPROVED: Calculate combined risk grade
-        credit_grade = self.policy.get_credit_grade(credit_score)
-        dti_grade = self.policy.get_dti_grade(dti)
+    def evaluate_batch(
+        self,
+        annual_income: np.ndarray,
+        loan_amount: np.ndarray,
+        credit_score: np.ndarray,
+        dti: np.ndarray,
+        dti_stress: np.ndarray,
+        monthly_payment: np.ndarray
+    ) -> AffordabilityBatchResult:
+        """Vectorized counterpart of `evaluate` over application columns."""
+        policy = self.policy
+        dti_bp = _to_basis_points_vec(dti)
+        stress_passed = np.less_equal(
+            _to_basis_points_vec(dti_stress), policy._stress_threshold_bp)
+
+        mult_thresholds = np.array(policy._mult_thresholds)
+        mult_values = np.array(policy._mult_values + [3.0])
+        idx = np.searchsorted(mult_thresholds, credit_score, side="right") - 1
+        max_mortgage = annual_income * mult_values[idx]  # idx -1 → fallback
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            utilization = np.where(
+                max_mortgage > 0, loan_amount / max_mortgage, np.inf)
+
+        # Same hierarchy as _determine_decision_and_grade
+        declined = (
+            (max_mortgage <= 0)
+            | np.greater(dti_bp, policy._max_dti_bp)
+            | (utilization > policy.max_lti_excess)
+        )
+        review = (
+            (utilization > policy.review_lti_excess)
+            | np.greater(dti_bp, policy._review_threshold_bp)
+            | ~stress_passed
+        )
+        decision_code = np.select(
+            [declined, review], [0, 1], default=2).astype(np.int8)
+        approved = decision_code == 2
+
+        # Approved grade: most conservative of credit and DTI grade
+        credit_thresholds = np.array(policy._credit_thresholds)
+        credit_values = np.array(policy._credit_values + ["C"])
+        idx = np.searchsorted(credit_thresholds, credit_score, side="right") - 1
+        credit_grade = credit_values[idx]
+
+        dti_thresholds = np.array(policy._dti_thresholds_bp)
+        dti_values = np.array(policy._dti_values + ["C"])
+        dti_grade = dti_values[
+            np.searchsorted(dti_thresholds, dti_bp, side="left")]
+
+        approved_grade = np.where(
+            credit_grade >= dti_grade, credit_grade, dti_grade)
+        risk_grade = np.where(
+            approved,
+            approved_grade,
+            np.where(declined, "", policy.default_review_grade)
+        )
 
-        # Take the most conservative (highest letter) grade
-        final_grade = max(credit_grade, dti_grade)
+        recommended_rate = np.full(risk_grade.shape, np.nan)
+        for grade in np.unique(risk_grade[~declined]):
+            recommended_rate[risk_grade == grade] = \
+                policy.get_recommended_rate(str(grade))
 
-        return Decision.APPROVED, final_grade
+        return AffordabilityBatchResult(
+            max_mortgage=max_mortgage,
+            monthly_payment=monthly_payment,
+            dti_ratio=dti,
+            stress_test_passed=stress_passed,
+            decision_code=decision_code,
+            risk_grade=risk_grade,
+            recommended_rate=recommended_rate
+        )
 
 
 class MortgageService:
     """Orchestrates the mortgage affordability workflow."""
 
-    def __init__(self, policy: LendingPolicy | None = None):
+    def __init__(
+        self,
+        policy: LendingPolicy | None = None,
+        cache_size: int = 65536,
+        homogeneous_rates: bool = False
+    ):
         self.policy = policy or LendingPolicy()
         self.evaluator = AffordabilityEvaluator(self.policy)
+        self._cache_size = cache_size
+        # Policy members read by the _execute fast path, bound once (the
+        # policy is frozen, so they cannot go stale)
+        self._stress_threshold_bp = self.policy._stress_threshold_bp
+        self._get_multiplier = self.policy.get_multiplier
+        self._get_recommended_rate = self.policy.get_recommended_rate
+        self._decide = self.policy._decide
+        # Rates and term shared across applications: derive stressed payments
+        # from the cached stress/base ratio instead of a second amortization.
+        # Single applications only (bypassing the compiled kernel); the batch
+        # paths amortize both rates in one pass and warn that it is ignored
+        self.homogeneous_rates = homogeneous_rates
+        # Compiled scoring kernel, or None to use the Python calculators
+        self._kernel = _UNBOUND
+        # Parallel batch kernel, or None to use the NumPy batch path
+        self._batch_kernel = _UNBOUND
+        # Per-service LRU of results; LoanApplication is frozen, so it hashes
+        # and compares as the tuple of its fields (0 disables caching)
+        self._execute_cached = lru_cache(maxsize=cache_size)(self._execute)
+
+    def __reduce__(self):
+        """Pickle the constructor arguments; kernels and cache are rebuilt."""
+        return (self.__class__,
+                (self.policy, self._cache_size, self.homogeneous_rates))
+
+    def _bind_kernels(self) -> None:
+        """Resolve kernels still unbound (explicit overrides are kept)."""
+        score_core, score_batch = _load_kernels()
+        if self._kernel is _UNBOUND:
+            self._kernel = score_core
+        if self._batch_kernel is _UNBOUND:
+            self._batch_kernel = score_batch
+
+    def execute_workflow(
+        self, app: LoanApplication | LoanApplicationBatch | np.ndarray | Any
+    ) -> AffordabilityResult | AffordabilityBatchResult:
+        """
+        Execute full affordability assessment workflow.
+
+        Batches, structured ndarrays and DataFrames take the batch path; any
+        other object with the `LoanApplication` attributes (e.g. a pydantic
+        model) is scored on the scalar path, cached only for LoanApplication.
+        """
+        if isinstance(app, LoanApplication):
+            return self._execute_cached(app)
+
+        if (isinstance(app, (LoanApplicationBatch, np.ndarray))
+                or hasattr(app, "to_records")):  # pandas DataFrame
+            return self.execute_workflow_batch(app)
 
-    def execute_workflow(self, app: LoanApplication) -> AffordabilityResult:
-        """Execute full affordability assessment workflow."""
+        return self._execute(app)
+
+    def _execute(self, app: LoanApplication) -> AffordabilityResult:
+        """
+        Score a single application (uncached).
 
-        # 1. Calculate monthly payments
-        monthly_payment = MortgageCalculator.calculate_monthly_payment(
-            app.loan_amount, app.base_rate, app.term_years
+        Fast path: the calculator and `AffordabilityEvaluator.evaluate` steps
+        are inlined with policy members pre-bound on the service, so the
+        evaluator is bypassed here. Keep both in sync.
+        """
+        income = app.annual_income
+        debts = app.monthly_debts
+        loan = app.loan_amount
+        credit_score = app.credit_score
+
+        # 1-2. Payments and DTI ratios
+        if self._kernel is _UNBOUND:
+            self._bind_kernels()
+        if self._kernel is not None and not self.homogeneous_rates:
+            MortgageCalculator._validate_term(app.term_years)  # kernel takes int64
+            monthly_payment, dti, dti_stress = self._kernel(
+                income, debts, loan, app.base_rate, app.stress_rate,
+                app.term_years
+            )
+        else:
+            monthly_payment, stressed_payment = \
+                MortgageCalculator.calculate_payment_pair(
+                    loan, app.base_rate, app.stress_rate, app.term_years,
+                    self.homogeneous_rates
+                )
+            if income == 0:
+                dti = dti_stress = 0.0
+            else:
+                monthly_income = income / 12
+                dti = (debts + monthly_payment) / monthly_income
+                dti_stress = (debts + stressed_payment) / monthly_income
+
+        # 3. Decision (see AffordabilityEvaluator._determine_decision_and_grade)
+        stress_passed = to_basis_points(dti_stress) <= self._stress_threshold_bp
+        max_mortgage = income * self._get_multiplier(credit_score)
+        decision, risk_grade = self._decide(
+            dti, loan, max_mortgage, stress_passed, credit_score)
+        recommended_rate = (
+            None if decision is Decision.DECLINED
+            else self._get_recommended_rate(risk_grade)
         )
-        stressed_payment = MortgageCalculator.calculate_monthly_payment(
-            app.loan_amount, app.stress_rate, app.term_years
+
+        return AffordabilityResult(
+            max_mortgage=max_mortgage,
+            monthly_payment=monthly_payment,
+            dti_ratio=dti,
+            stress_test_passed=stress_passed,
+            decision=decision,
+            risk_grade=risk_grade,  # None for declined
+            recommended_rate=recommended_rate  # None for declined
         )
 
+    def execute_workflow_batch(
+        self, apps: LoanApplicationBatch | np.ndarray | Any
+    ) -> AffordabilityBatchResult:
+        """
+        Execute the affordability workflow over a batch of applications.
+
+        `apps` is a `LoanApplicationBatch`, or a structured ndarray (or
+        DataFrame) accepted by `LoanApplicationBatch.from_array`.
+        """
+        if self.homogeneous_rates:
+            warnings.warn(
+                "homogeneous_rates only applies to single applications; "
+                "batch scoring amortizes base and stress rates directly",
+                stacklevel=2
+            )
+
+        if not isinstance(apps, LoanApplicationBatch):
+            apps = LoanApplicationBatch.from_array(apps)
+
+        if self._batch_kernel is _UNBOUND:
+            self._bind_kernels()
+        if self._batch_kernel is not None:
+            return self._execute_batch_kernel(apps)
+
+        loan = apps.loan_amount
+        income = apps.annual_income
+        debts = apps.monthly_debts
+
+        # 1. Calculate base and stressed payments in one (2, N) pass
+        rates = np.stack([apps.base_rate, apps.stress_rate])
+        monthly_payment, stressed_payment = \
+            MortgageCalculator.calculate_monthly_payment_vec(
+                loan, rates, apps.term_years
+            )
+
         # 2. Calculate DTI ratios
-        dti = MortgageCalculator.calculate_dti(
-            app.annual_income, app.monthly_debts, monthly_payment
-        )
-        dti_stress = MortgageCalculator.calculate_dti(
-            app.annual_income, app.monthly_debts, stressed_payment
-        )
+        dti = MortgageCalculator.calculate_dti_vec(
+            income, debts, monthly_payment)
+        dti_stress = MortgageCalculator.calculate_dti_vec(
+            income, debts, stressed_payment)
 
         # 3. Evaluate and return result
-        return self.evaluator.evaluate(app, dti, dti_stress, monthly_payment)
+        return self.evaluator.evaluate_batch(
+            income, loan, apps.credit_score,
+            dti, dti_stress, monthly_payment
+        )
 
+    def _execute_batch_kernel(
+        self, apps: LoanApplicationBatch
+    ) -> AffordabilityBatchResult:
+        """Score a batch with the parallel Numba kernel."""
+        if np.any(apps.term_years <= 0):
+            raise ValueError("Loan term must be positive")
+
+        policy = self.policy
+
+        # Grades as int8 indices; sorted so max() keeps the conservative one
+        grades = sorted(
+            set(policy._credit_values) | set(policy._dti_values)
+            | {policy.default_review_grade, "C"}
+        )
+        grade_idx = {grade: i for i, grade in enumerate(grades)}
+
+        n = len(apps)
+        out_payment = np.empty(n)
+        out_dti = np.empty(n)
+        out_max_mortgage = np.empty(n)
+        out_stress_passed = np.empty(n, dtype=np.bool_)
+        out_decision = np.empty(n, dtype=np.int8)
+        out_grade_idx = np.empty(n, dtype=np.int8)
+        out_rate = np.empty(n)
+
+        self._batch_kernel(
+            apps.annual_income, apps.monthly_debts, apps.loan_amount,
+            apps.credit_score, apps.base_rate, apps.stress_rate,
+            apps.term_years,
+            np.array(policy._mult_thresholds, dtype=np.int64),
+            np.array(policy._mult_values + [3.0]),
+            np.array(policy._credit_thresholds, dtype=np.int64),
+            np.array([grade_idx[g] for g in policy._credit_values + ["C"]],
+                     dtype=np.int8),
+            np.array(policy._dti_thresholds_bp, dtype=np.float64),
+            np.array([grade_idx[g] for g in policy._dti_values + ["C"]],
+                     dtype=np.int8),
+            np.array([policy.get_recommended_rate(g) for g in grades]),
+            policy._max_dti_bp, policy._review_threshold_bp,
+            policy._stress_threshold_bp,
+            policy.max_lti_excess, policy.review_lti_excess,
+            grade_idx[policy.default_review_grade],
+            out_payment, out_dti, out_max_mortgage, out_stress_passed,
+            out_decision, out_grade_idx, out_rate
+        )
 
+        return AffordabilityBatchResult(
+            max_mortgage=out_max_mortgage,
+            monthly_payment=out_payment,
+            dti_ratio=out_dti,
+            stress_test_passed=out_stress_passed,
+            decision_code=out_decision,
+            risk_grade=np.array(grades + [""])[out_grade_idx],  # -1 → ""
+            recommended_rate=out_rate
+        )
@@ -0,0 +1,157 @@
+"""
+Numba-compiled scoring kernels.
+
+Optional fast paths for `MortgageService`: the amortization and DTI math for
+one application, and a multithreaded kernel scoring a whole batch, compiled
+to native code. Requires `numba`; the service falls back to the pure-Python
+calculators and the NumPy batch path when it is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange, types
+
+# fastmath without 'nnan'/'ninf': the kernels must keep NaN and inf semantics
+# so non-finite DTI ratios are declined, as on the Python paths
+_FASTMATH = {"contract", "arcp", "reassoc", "nsz", "afn"}
+
+
+@njit(
+    types.UniTuple(types.float64, 3)(
+        types.float64,  # annual_income
+        types.float64,  # monthly_debts
+        types.float64,  # loan
+        types.float64,  # base_rate
+        types.float64,  # stress_rate
+        types.int64,    # years
+    ),
+    cache=True,
+    fastmath=_FASTMATH
+)
+def _score_core(income, debts, loan, rate, stress_rate, years):
+    """
+    Score the arithmetic core of one application.
+
+    Returns (monthly_payment, dti, dti_stress). A plain tuple rather than a
+    NamedTuple so the eager signature stays a simple tuple; threshold checks
+    are left to the caller, which compares in basis points.
+    """
+    if years <= 0:
+        raise ValueError("Loan term must be positive")
+
+    term_months = years * 12
+
+    # 1. Monthly payments (same formula as MortgageCalculator)
+    monthly_rate = rate / 12
+    if monthly_rate == 0:
+        payment = loan / term_months
+    else:
+        c = (1 + monthly_rate) ** term_months
+        payment = loan * (monthly_rate * c) / (c - 1)
+
+    monthly_rate = stress_rate / 12
+    if monthly_rate == 0:
+        stressed = loan / term_months
+    else:
+        c = (1 + monthly_rate) ** term_months
+        stressed = loan * (monthly_rate * c) / (c - 1)
+
+    # 2. DTI ratios
+    if income == 0:
+        dti = 0.0
+        dti_stress = 0.0
+    else:
+        monthly_income = income / 12
+        dti = (debts + payment) / monthly_income
+        dti_stress = (debts + stressed) / monthly_income
+
+    return payment, dti, dti_stress
+
+
+@njit(parallel=True, cache=True, fastmath=_FASTMATH)
+def _score_batch(
+    incomes, debts, loans, credits, base_rates, stress_rates, years,
+    mult_thresholds, mult_values,
+    credit_thresholds, credit_grade_idx,
+    dti_thresholds, dti_grade_idx,
+    rate_by_grade,
+    max_dti_bp, review_threshold_bp, stress_threshold_bp,
+    max_lti_excess, review_lti_excess, review_grade_idx,
+    out_payment, out_dti, out_max_mortgage, out_stress_passed,
+    out_decision, out_grade_idx, out_rate
+):
+    """
+    Score a batch of applications across threads.
+
+    Lookup tables follow `AffordabilityEvaluator.evaluate_batch`: value
+    arrays carry their fallback as the last entry and DTI thresholds are in
+    basis points. Grades are int8 indices
+    into the caller's sorted grade letters (-1 for declined), decisions use
+    the 0/1/2 decision codes and declined rates are NaN. Term lengths must
+    already be validated.
+    """
+    for i in prange(incomes.shape[0]):
+        income = incomes[i]
+        loan = loans[i]
+        term_months = years[i] * 12
+
+        # 1. Monthly payments
+        monthly_rate = base_rates[i] / 12
+        if monthly_rate == 0:
+            payment = loan / term_months
+        else:
+            c = (1 + monthly_rate) ** term_months
+            payment = loan * (monthly_rate * c) / (c - 1)
+
+        monthly_rate = stress_rates[i] / 12
+        if monthly_rate == 0:
+            stressed = loan / term_months
+        else:
+            c = (1 + monthly_rate) ** term_months
+            stressed = loan * (monthly_rate * c) / (c - 1)
+
+        # 2. DTI ratios
+        if income == 0:
+            dti = 0.0
+            dti_stress = 0.0
+        else:
+            monthly_income = income / 12
+            dti = (debts[i] + payment) / monthly_income
+            dti_stress = (debts[i] + stressed) / monthly_income
+
+        # 3. Decision
+        # NaN DTI counts as above every threshold (as in to_basis_points)
+        dti_bp = np.rint(dti * 10000)
+        if np.isnan(dti_bp):
+            dti_bp = np.inf
+        stress_passed = np.rint(dti_stress * 10000) <= stress_threshold_bp
+
+        idx = np.searchsorted(mult_thresholds, credits[i], side="right") - 1
+        max_mortgage = income * mult_values[idx]  # idx -1 → fallback
+        if max_mortgage > 0:
+            utilization = loan / max_mortgage
+        else:
+            utilization = np.inf
+
+        if (max_mortgage <= 0 or dti_bp > max_dti_bp
+                or utilization > max_lti_excess):
+            decision = 0
+            grade = -1
+        elif (utilization > review_lti_excess or dti_bp > review_threshold_bp
+                or not stress_passed):
+            decision = 1
+            grade = review_grade_idx
+        else:
+            decision = 2
+            idx = np.searchsorted(credit_thresholds, credits[i], side="right") - 1
+            grade = credit_grade_idx[idx]
+            dti_grade = dti_grade_idx[np.searchsorted(dti_thresholds, dti_bp)]
+            if dti_grade > grade:
+                grade = dti_grade
+
+        out_payment[i] = payment
+        out_dti[i] = dti
+        out_max_mortgage[i] = max_mortgage
+        out_stress_passed[i] = stress_passed
+        out_decision[i] = decision
+        out_grade_idx[i] = grade
+        out_rate[i] = np.nan if grade < 0 else rate_by_grade[grade]
@@ -2,14 +2,37 @@
 Simple pytest tests for MortgageService.
 """
 
+import pickle
+import subprocess
+import sys
+import warnings
+from dataclasses import FrozenInstanceError, replace
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
 from loan_affordability.service import (
     LoanApplication,
+    LoanApplicationBatch,
+    MortgageCalculator,
     MortgageService,
     LendingPolicy,
     Decision
 )
 
 
+def assert_results_match(actual, expected):
+    """Compare AffordabilityResults, allowing float noise in computed fields."""
+    assert actual.decision == expected.decision
+    assert actual.risk_grade == expected.risk_grade
+    assert actual.stress_test_passed == expected.stress_test_passed
+    assert actual.max_mortgage == pytest.approx(expected.max_mortgage, rel=1e-6)
+    assert actual.monthly_payment == pytest.approx(expected.monthly_payment, rel=1e-6)
+    assert actual.dti_ratio == pytest.approx(expected.dti_ratio, rel=1e-6)
+    assert actual.recommended_rate == pytest.approx(expected.recommended_rate, rel=1e-6)
+
+
 def test_approved_applicant():
     """Test that a high income applicant with no debt gets approved."""
     service = MortgageService()
@@ -95,3 +118,578 @@ def test_zero_income():
     result = service.execute_workflow(app)
 
     assert result.decision == Decision.DECLINED
+
+
+def test_batch_matches_scalar_workflow():
+    """Test that the vectorized batch path agrees with the scalar path."""
+    service = MortgageService()
+
+    apps = [
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=300000,
+            credit_score=800,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=500000,
+            credit_score=700,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=300000,
+            credit_score=800,
+            monthly_debts=2400
+        ),
+        LoanApplication(
+            annual_income=50000,
+            loan_amount=180000,
+            credit_score=700,
+            monthly_debts=800,
+            stress_rate=0.07
+        ),
+        LoanApplication(
+            annual_income=0,
+            loan_amount=200000,
+            credit_score=750,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=250000,
+            credit_score=720,
+            monthly_debts=500,
+            base_rate=0.0
+        ),
+    ]
+    batch = np.array(
+        [(a.annual_income, a.monthly_debts, a.loan_amount,
+          a.credit_score, a.base_rate, a.stress_rate)
+         for a in apps],
+        dtype=[('annual_income', 'f8'), ('monthly_debts', 'f8'), ('loan_amount', 'f8'),
+               ('credit_score', 'i8'), ('base_rate', 'f8'), ('stress_rate', 'f8')]
+    )
+
+    result = service.execute_workflow(batch)
+
+    for batch_result, app in zip(result.to_results(), apps):
+        assert_results_match(batch_result, service.execute_workflow(app))
+
+
+def test_numba_kernel_matches_python_path():
+    """Test that the compiled kernel agrees with the pure-Python calculators."""
+    pytest.importorskip("numba")
+
+    jit_service = MortgageService(cache_size=0)
+    py_service = MortgageService(cache_size=0)
+    py_service._kernel = None
+    jit_service._bind_kernels()
+    assert jit_service._kernel is not None
+
+    for app in (
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=300000,
+            credit_score=800,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=50000,
+            loan_amount=180000,
+            credit_score=700,
+            monthly_debts=800,
+            stress_rate=0.07
+        ),
+        LoanApplication(
+            annual_income=0,
+            loan_amount=200000,
+            credit_score=750,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=250000,
+            credit_score=720,
+            monthly_debts=500,
+            base_rate=0.0
+        ),
+    ):
+        assert_results_match(jit_service.execute_workflow(app), py_service.execute_workflow(app))
+
+
+def test_monthly_payment_values():
+    """Test amortized payments (native module or Python fallback)."""
+    payment = MortgageCalculator.calculate_monthly_payment(300000, 0.04, 25)
+    zero_rate = MortgageCalculator.calculate_monthly_payment(120000, 0.0, 10)
+
+    assert payment == pytest.approx(1583.51, abs=0.005)
+    assert zero_rate == pytest.approx(1000.0)
+
+    with pytest.raises(ValueError):
+        MortgageCalculator.calculate_monthly_payment(300000, 0.04, 0)
+
+
+def test_payment_pair_matches_separate_payments():
+    """Test that the fused payment pair equals two separate amortizations."""
+    for loan, base_rate, stress_rate, years in (
+        (300000, 0.04, 0.052, 25),
+        (120000, 0.0, 0.03, 10),
+    ):
+        base, stressed = MortgageCalculator.calculate_payment_pair(
+            loan, base_rate, stress_rate, years)
+
+        assert base == pytest.approx(
+            MortgageCalculator.calculate_monthly_payment(loan, base_rate, years), rel=1e-9)
+        assert stressed == pytest.approx(
+            MortgageCalculator.calculate_monthly_payment(loan, stress_rate, years), rel=1e-6)
+
+
+def test_homogeneous_payment_pair_uses_cached_ratio():
+    """Test that homogeneous rates scale the stressed payment by the cached ratio."""
+    hits = MortgageCalculator.stress_payment_ratio.cache_info().hits
+
+    for loan in (200000, 300000):
+        _, stressed = MortgageCalculator.calculate_payment_pair(
+            loan, 0.04, 0.052, 25, homogeneous_rates=True)
+        assert stressed == pytest.approx(
+            MortgageCalculator.calculate_monthly_payment(loan, 0.052, 25), rel=1e-9)
+
+    assert MortgageCalculator.stress_payment_ratio.cache_info().hits >= hits + 1
+
+
+def test_dti_values():
+    """Test DTI ratios, including the zero-income case."""
+    assert MortgageCalculator.calculate_dti(60000, 500, 1583.51) == pytest.approx(0.4167, abs=5e-5)
+    assert MortgageCalculator.calculate_dti(0, 500, 1583.51) == 0.0
+
+
+def test_policy_threshold_lookups():
+    """Test multiplier and grade lookups at and around the thresholds."""
+    policy = LendingPolicy()
+
+    assert policy.get_multiplier(800) == 4.5
+    assert policy.get_multiplier(750) == 4.5
+    assert policy.get_multiplier(749) == 4.0
+    assert policy.get_multiplier(0) == 3.0
+    assert policy.get_credit_grade(700) == "B"
+    assert policy.get_credit_grade(699) == "C"
+    assert policy.get_dti_grade(0.30) == "A"
+    assert policy.get_dti_grade(0.3001) == "B"
+    assert policy.get_dti_grade(1.5) == "C"
+
+    # Scores below the lowest configured threshold use the fallbacks
+    custom = LendingPolicy(multipliers={600: 4.0}, credit_grades={600: "A"})
+    assert custom.get_multiplier(599) == 3.0
+    assert custom.get_credit_grade(599) == "C"
+
+
+def test_application_batch_from_records():
+    """Test that a SoA batch built from records scores like the scalar path."""
+    apps = [
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=300000,
+            credit_score=800,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=200000,
+            credit_score=680,
+            monthly_debts=1200,
+            term_years=30
+        ),
+        LoanApplication(
+            annual_income=40000,
+            loan_amount=200000,
+            credit_score=700,
+            monthly_debts=1500
+        ),
+    ]
+    batch = LoanApplicationBatch.from_records(apps)
+
+    assert len(batch) == 3
+    assert batch.credit_score.dtype == np.int32
+    assert batch.annual_income.flags['C_CONTIGUOUS']
+
+    policy = LendingPolicy(review_threshold=0.40)
+    service = MortgageService(policy)
+    for batch_result, app in zip(batch.execute(policy).to_results(), apps):
+        assert_results_match(batch_result, service.execute_workflow(app))
+
+
+def test_recommended_rate_table():
+    """Test recommended rates per grade, including unknown grades."""
+    policy = LendingPolicy()
+
+    assert policy.get_recommended_rate("A") == pytest.approx(0.038, rel=1e-6)
+    assert policy.get_recommended_rate("B") == pytest.approx(0.042, rel=1e-6)
+    assert policy.get_recommended_rate("C") == pytest.approx(0.055, rel=1e-6)
+    assert policy.get_recommended_rate("D") == pytest.approx(0.042, rel=1e-6)
+
+
+def test_hot_types_use_slots():
+    """Test that hot dataclasses carry no per-instance __dict__."""
+    app = LoanApplication(annual_income=100000, loan_amount=300000, monthly_debts=0)
+    result = MortgageService().execute_workflow(app)
+
+    assert not hasattr(app, '__dict__')
+    assert not hasattr(result, '__dict__')
+    assert not hasattr(LendingPolicy(), '__dict__')
+    assert hash(app) == hash(LoanApplication(
+        annual_income=100000,
+        loan_amount=300000,
+        monthly_debts=0
+    ))
+
+
+def test_repeated_applications_hit_cache():
+    """Test that identical applications are served from the result cache."""
+    service = MortgageService()
+
+    first = service.execute_workflow(
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=250000,
+            credit_score=720,
+            monthly_debts=500
+        ))
+    second = service.execute_workflow(
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=250000,
+            credit_score=720,
+            monthly_debts=500
+        ))
+
+    assert second is first
+    assert service._execute_cached.cache_info().hits == 1
+
+    uncached = MortgageService(cache_size=0)
+    assert_results_match(uncached.execute_workflow(
+        LoanApplication(
+            annual_income=60000,
+            loan_amount=250000,
+            credit_score=720,
+            monthly_debts=500
+        )), first)
+
+
+def test_dti_threshold_boundaries():
+    """Test that a DTI exactly at a threshold does not trip it."""
+    service = MortgageService()
+
+    # 120k income → 10k monthly; with no loan the DTI is debts / 10k
+    at_threshold = LoanApplication(
+        annual_income=120000,
+        loan_amount=0,
+        monthly_debts=4300
+    )
+    over_threshold = LoanApplication(
+        annual_income=120000,
+        loan_amount=0,
+        monthly_debts=4301
+    )
+    at_hard_limit = LoanApplication(
+        annual_income=120000,
+        loan_amount=0,
+        monthly_debts=5000
+    )
+    over_hard_limit = LoanApplication(
+        annual_income=120000,
+        loan_amount=0,
+        monthly_debts=5001
+    )
+    apps = [at_threshold, over_threshold, at_hard_limit, over_hard_limit]
+
+    decisions = [service.execute_workflow(a).decision for a in apps]
+    assert decisions == [Decision.APPROVED, Decision.REVIEW, Decision.REVIEW, Decision.DECLINED]
+    assert LoanApplicationBatch.from_records(apps).execute().decisions == decisions
+
+
+def test_inlined_workflow_matches_evaluator():
+    """Test that the inlined service fast path agrees with AffordabilityEvaluator."""
+    policy = LendingPolicy()
+    service = MortgageService(policy, cache_size=0)
+    service._kernel = None
+
+    for app in (
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=300000,
+            credit_score=800,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=430000,
+            credit_score=700,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=100000,
+            loan_amount=500000,
+            credit_score=700,
+            monthly_debts=0
+        ),
+        LoanApplication(
+            annual_income=50000,
+            loan_amount=180000,
+            credit_score=700,
+            monthly_debts=800,
+            stress_rate=0.07
+        ),
+        LoanApplication(
+            annual_income=0,
+            loan_amount=200000,
+            credit_score=750,
+            monthly_debts=0
+        ),
+    ):
+        payment, stressed = MortgageCalculator.calculate_payment_pair(
+            app.loan_amount, app.base_rate, app.stress_rate, app.term_years)
+        expected = service.evaluator.evaluate(
+            app,
+            MortgageCalculator.calculate_dti(app.annual_income, app.monthly_debts, payment),
+            MortgageCalculator.calculate_dti(app.annual_income, app.monthly_debts, stressed),
+            payment
+        )
+        assert_results_match(service.execute_workflow(app), expected)
+
+
+def test_policy_decision_ladder_is_specialized():
+    """Test that the generated decision ladder uses the policy's own thresholds."""
+    policy = LendingPolicy(max_dti=0.45, review_threshold=0.35,
+                           max_lti_excess=float('inf'), default_review_grade="B")
+
+    assert 4500 in policy._decide.__code__.co_consts
+    assert policy._decide(0.46, 100000, 400000, True, 800) == (Decision.DECLINED, None)
+    assert policy._decide(0.36, 100000, 400000, True, 800) == (Decision.REVIEW, "B")
+    assert policy._decide(0.20, 100000, 400000, False, 800) == (Decision.REVIEW, "B")
+    assert policy._decide(0.20, 1000000, 400000, True, 800) == (Decision.REVIEW, "B")
+    assert policy._decide(0.20, 100000, 400000, True, 800) == (Decision.APPROVED, "A")
+    assert policy._decide(0.20, 100000, 0, True, 800) == (Decision.DECLINED, None)
+
+
+def test_parallel_batch_kernel_matches_numpy_path():
+    """Test that the parallel Numba batch kernel agrees with the NumPy batch path."""
+    pytest.importorskip("numba")
+
+    rng = np.random.default_rng(7)
+    n = 2000
+    batch = LoanApplicationBatch(
+        annual_income=rng.choice([0.0, 30000.0, 60000.0, 100000.0, 150000.0], n),
+        monthly_debts=rng.uniform(0, 2500, n),
+        loan_amount=rng.uniform(50000, 700000, n),
+        credit_score=rng.integers(550, 850, n).astype(np.int32),
+        base_rate=rng.choice([0.0, 0.03, 0.04], n),
+        stress_rate=rng.choice([0.052, 0.07], n),
+        term_years=rng.choice([10, 25, 30], n).astype(np.int32),
+    )
+    # Non-finite DTI rows: NaN and inf debts must be declined by both paths
+    batch.annual_income[:2] = 100000.0
+    batch.monthly_debts[:2] = [np.nan, np.inf]
+
+    jit_service = MortgageService()
+    np_service = MortgageService()
+    np_service._batch_kernel = None
+    jit_service._bind_kernels()
+    assert jit_service._batch_kernel is not None
+
+    jit_result = jit_service.execute_workflow_batch(batch)
+    np_result = np_service.execute_workflow_batch(batch)
+
+    assert set(np_result.decision_code) == {0, 1, 2}
+    assert list(np_result.decision_code[:2]) == [0, 0]
+    np.testing.assert_array_equal(jit_result.decision_code, np_result.decision_code)
+    np.testing.assert_array_equal(jit_result.risk_grade, np_result.risk_grade)
+    np.testing.assert_array_equal(jit_result.stress_test_passed, np_result.stress_test_passed)
+    np.testing.assert_allclose(jit_result.monthly_payment, np_result.monthly_payment, rtol=1e-9)
+    np.testing.assert_allclose(jit_result.dti_ratio, np_result.dti_ratio, rtol=1e-9)
+    np.testing.assert_allclose(jit_result.max_mortgage, np_result.max_mortgage, rtol=1e-9)
+    np.testing.assert_allclose(jit_result.recommended_rate, np_result.recommended_rate, rtol=1e-9)
+
+
+def test_non_finite_dti_is_declined():
+    """Test that an overflowing DTI is declined rather than crashing."""
+    app = LoanApplication(annual_income=1e-310, monthly_debts=100, loan_amount=1000)
+    infinite = LoanApplication(
+        annual_income=float('inf'),
+        monthly_debts=float('inf'),
+        loan_amount=1000
+    )
+
+    assert MortgageService().execute_workflow(app).decision == Decision.DECLINED
+    assert LoanApplicationBatch.from_records([app]).execute().decisions == [Decision.DECLINED]
+
+    numpy_service = MortgageService()
+    numpy_service._batch_kernel = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        result = numpy_service.execute_workflow_batch(
+            LoanApplicationBatch.from_records([app, infinite]))
+    assert result.decisions == [Decision.DECLINED, Decision.DECLINED]
+    assert LendingPolicy()._decide(float('nan'), 0, 1000, True, 800) == (Decision.DECLINED, None)
+
+
+def test_dti_grade_uses_basis_points():
+    """Test that a DTI within half a basis point of a grade boundary keeps the lower grade."""
+    # 3000.4 / 10000 monthly income → DTI 0.30004, i.e. 3000 bp → grade A
+    app = LoanApplication(
+        annual_income=120000,
+        monthly_debts=3000.4,
+        loan_amount=0,
+        credit_score=800
+    )
+
+    numpy_service = MortgageService()
+    numpy_service._batch_kernel = None
+    results = [
+        MortgageService().execute_workflow(app),
+        LoanApplicationBatch.from_records([app]).execute().to_results()[0],
+        numpy_service.execute_workflow_batch(
+            LoanApplicationBatch.from_records([app])).to_results()[0],
+    ]
+
+    for result in results:
+        assert result.decision == Decision.APPROVED
+        assert result.risk_grade == "A"
+        assert result.recommended_rate == pytest.approx(0.038, rel=1e-6)
+
+
+def test_policy_and_service_pickle():
+    """Test that policies and services survive pickling with a working decision ladder."""
+    policy = LendingPolicy(max_dti=0.45, max_lti_excess=float('inf'))
+    service = MortgageService(policy, cache_size=128, homogeneous_rates=True)
+    app = LoanApplication(
+        annual_income=100000,
+        loan_amount=300000,
+        credit_score=800,
+        monthly_debts=0
+    )
+
+    restored_policy = pickle.loads(pickle.dumps(policy))
+    restored_service = pickle.loads(pickle.dumps(service))
+
+    assert restored_policy == policy
+    assert restored_policy._decide(0.46, 100000, 400000, True, 800) == (Decision.DECLINED, None)
+    assert restored_service.policy == policy
+    assert restored_service._execute_cached.cache_info().maxsize == 128
+    assert restored_service.homogeneous_rates is True
+    assert_results_match(restored_service.execute_workflow(app), service.execute_workflow(app))
+
+
+def test_policy_accepts_numpy_scalars():
+    """Test that numpy scalar thresholds compile into the decision ladder."""
+    policy = LendingPolicy(max_dti=np.float64(0.5), max_lti_excess=np.float64(1.3),
+                           review_lti_excess=np.float64(1.1), default_review_grade=np.str_("C"))
+    app = LoanApplication(
+        annual_income=100000,
+        loan_amount=300000,
+        credit_score=800,
+        monthly_debts=0
+    )
+
+    assert MortgageService(policy).execute_workflow(app).decision == Decision.APPROVED
+
+
+def test_policy_is_immutable():
+    """Test that policy changes fail loudly and replace() re-derives the tables."""
+    policy = LendingPolicy()
+
+    with pytest.raises(FrozenInstanceError):
+        policy.max_dti = 0.40
+    with pytest.raises(TypeError):
+        policy.multipliers[800] = 5.0
+
+    # DTI 0.45: REVIEW under the default 50% limit, DECLINED under a 40% limit
+    app = LoanApplication(annual_income=120000, loan_amount=0, monthly_debts=4500)
+    stricter = replace(policy, max_dti=0.40)
+
+    assert stricter == LendingPolicy(max_dti=0.40)
+    assert MortgageService(policy).execute_workflow(app).decision == Decision.REVIEW
+    assert MortgageService(stricter).execute_workflow(app).decision == Decision.DECLINED
+
+
+def test_homogeneous_rates_use_cached_ratio():
+    """Test that homogeneous_rates scores single applications via the cached ratio."""
+    service = MortgageService(cache_size=0, homogeneous_rates=True)
+    reference = MortgageService(cache_size=0)
+    app = LoanApplication(annual_income=50000, loan_amount=180000, credit_score=700,
+                          monthly_debts=800, stress_rate=0.07)
+
+    before = MortgageCalculator.stress_payment_ratio.cache_info()
+    result = service.execute_workflow(app)
+    after = MortgageCalculator.stress_payment_ratio.cache_info()
+
+    assert after.hits + after.misses > before.hits + before.misses
+    assert_results_match(result, reference.execute_workflow(app))
+
+    with pytest.warns(UserWarning, match="homogeneous_rates"):
+        service.execute_workflow_batch(LoanApplicationBatch.from_records([app]))
+
+
+def test_fractional_term_is_rejected():
+    """Test that a fractional term raises instead of being truncated to whole years."""
+    app = LoanApplication(
+        annual_income=100000,
+        monthly_debts=0,
+        loan_amount=200000,
+        term_years=2.5
+    )
+    py_service = MortgageService(cache_size=0)
+    py_service._kernel = None
+
+    with pytest.raises(ValueError):
+        MortgageCalculator.calculate_monthly_payment(200000, 0.04, 2.5)
+    with pytest.raises(ValueError):
+        MortgageCalculator.calculate_payment_pair(200000, 0.04, 0.052, 2.5)
+    with pytest.raises(ValueError):
+        MortgageService().execute_workflow(app)
+    with pytest.raises(ValueError):
+        py_service.execute_workflow(app)
+    with pytest.raises(ValueError):
+        LoanApplicationBatch.from_records([app])
+    with pytest.raises(ValueError):
+        LoanApplicationBatch.from_array(np.array(
+            [(100000, 0, 200000, 2.5)],
+            dtype=[('annual_income', 'f8'), ('monthly_debts', 'f8'),
+                   ('loan_amount', 'f8'), ('term_years', 'f8')]
+        ))
+
+    # Whole-year floats are still accepted
+    assert MortgageCalculator.calculate_monthly_payment(300000, 0.04, 25.0) == \
+        pytest.approx(1583.51, abs=0.005)
+
+
+def test_execute_workflow_scores_duck_typed_application():
+    """Test that any object with the application attributes is scored."""
+    app = SimpleNamespace(
+        annual_income=100000,
+        monthly_debts=0,
+        loan_amount=300000,
+        credit_score=800,
+        base_rate=0.04,
+        stress_rate=0.052,
+        term_years=25
+    )
+
+    result = MortgageService().execute_workflow(app)
+
+    assert result.decision == Decision.APPROVED
+    expected = MortgageService().execute_workflow(LoanApplication(**vars(app)))
+    assert_results_match(result, expected)
+
+
+def test_import_defers_numba_kernels():
+    """Test that importing the service does not import the Numba kernels."""
+    code = (
+        "import sys, loan_affordability.service; "
+        "print('loan_affordability.service_numba' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout
+
+    assert out.strip() == "False"